@@ -4,18 +4,52 @@ Rabindra Poetry Scraper
 Scrapes poems from rabindra-rachanabali.nltr.org
 
 Usage:
-    uv run main.py
+    uv run main.py [--no-cache] [--quiet | --verbose]
 """
 
-from poem_scraper import RabindraPoetryaScraper
+import argparse
+import logging
+import sys
+
+from poem_scraper import DEFAULT_CACHE_DIR, AsyncRabindraScraper
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"download every page again instead of reusing {DEFAULT_CACHE_DIR}",
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "-q", "--quiet", action="store_true", help="only log warnings and errors"
+    )
+    verbosity.add_argument(
+        "-v", "--verbose", action="store_true", help="also log every fetched page"
+    )
+    return parser.parse_args()
 
 
 def main():
-    scraper = RabindraPoetryaScraper()
+    args = parse_args()
+    if args.quiet:
+        level = logging.WARNING
+    elif args.verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    logging.basicConfig(
+        level=level, format="%(asctime)s %(message)s", stream=sys.stderr
+    )
+
+    scraper = AsyncRabindraScraper(
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR
+    )
 
     # Test with first collection
     # print("Testing with collection 1...")
-    # test_poems = scraper.scrape_collection(53)
+    # test_poems = asyncio.run(scraper.scrape_collection(53))
     # if test_poems:
     #     print(f"Test successful! Found {len(test_poems)} poems")
     #     scraper.save_poems(test_poems, "output/rabindra_poems_test.json")
@@ -25,7 +59,7 @@ def main():
 
     # Scrape all collections
     print("Starting full scrape of all collections...")
-    all_poems = scraper.scrape_all_collections()
+    all_poems = scraper.run_all_collections()
     if all_poems:
         print(f"Scrape completed! Found {all_poems} poems in total.")
     else:
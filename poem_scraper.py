@@ -1,77 +1,362 @@
+import asyncio
+import contextlib
+import functools
+import gzip
+import hashlib
+import html as html_lib
+import io
+import itertools
 import requests
-import parsel
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+import aiohttp
+from aiolimiter import AsyncLimiter
+from lxml import etree
+from lxml import html as lxml_html
+import logging
+import orjson
 import time
 import os
 import re
-from urllib.parse import urljoin
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from typing import List, Dict, Any, BinaryIO, TextIO
 import unicodedata
 
+try:
+    import uvloop
+except ImportError:  # optional, only used to speed up the event loop
+    uvloop = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional, only needed for parser_backend="lexbor"
+    LexborHTMLParser = None
+
+
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns used on every parsed line and written poem
+_RE_NL = re.compile(r"\n+")
+_PUNCT_CHARS = "।?!,—"
+# Drops Bengali and English digits
+_DIGITS_TRANS = str.maketrans("", "", "০১২৩৪৫৬৭৮৯0123456789")
+# Drops digits and pads each punctuation mark with a space on both sides
+_PROCESS_TRANS = {
+    **_DIGITS_TRANS,
+    **str.maketrans({c: f" {c} " for c in _PUNCT_CHARS}),
+}
+_RE_MULTI_NL = re.compile(r"\n{2,}")
+# Joins the lines of a page for batch processing; U+001E never composes
+# with its neighbours under NFC
+_LINE_SEP = "\x1e"
+# Pages are kept as the UTF-8 bytes the site sends, so the next page
+# checks below work on bytes too
+_NEXT_WORD = "পরবর্তী".encode("utf-8")
+# Cheap guess at the 'পরবর্তী' (next page) link on the raw HTML, used to
+# start downloading the next page before the current one is parsed
+_RE_NEXT_HREF = re.compile(rb'href="([^"]+)"[^>]*>[^<]*' + _NEXT_WORD)
+
+# lxml's HTML parser without comments, which only split the text around
+# them; fed the raw bytes so no str round trip is needed
+_HTML_PARSER = lxml_html.HTMLParser(
+    encoding="utf-8", remove_comments=True, huge_tree=False
+)
+
+# XPath expressions of the lxml parser, compiled once and called on the
+# lxml elements directly
+_KOBITA_XPATH = etree.XPath('//div[contains(@id, "kobita")]')
+_P_XPATH = etree.XPath(".//p")
+_TEXT_XPATH = etree.XPath(".//text()")
+_LIST_TABLE_XPATH = etree.XPath('//table[@class="list"]')
+_LIST_ANCHOR_XPATH = etree.XPath('//table[@class="list"]//a[@href]')
+_CONTENT_ANCHOR_XPATH = etree.XPath('//div[contains(@class, "content")]//a[@href]')
+_NEXT_PAGE_XPATH = etree.XPath('//a[contains(.//text(), "পরবর্তী")]/@href')
+
+# lxml and Lexbor already decode &nbsp; to \xa0, so one translate pass
+# is enough to normalize the spacing of a text node
+_NBSP_TRANS = str.maketrans({"\xa0": " ", "\n": " "})
+_NBSP_STRIP_TRANS = str.maketrans({"\xa0": " ", "\n": None, "\r": None})
+# Drops native newlines from <font> text, whose nbsp are counted instead
+_NEWLINE_STRIP_TRANS = str.maketrans({"\n": None, "\r": None})
+# Runs of spaces for <font>&nbsp;</font> indentation, shared instead of
+# allocated per tag
+_SPACES = tuple(" " * count for count in range(64))
+
+DEFAULT_CACHE_DIR = "output/.http_cache"
+
+# Output files stay open for the whole run; a large buffer lets the OS
+# see a few big writes instead of one per poem
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Transient server responses worth retrying, with the backoff urllib3 uses
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+
+def open_output(filename: str, mode: str = "w"):
+    """
+    Open an output file for writing, gzip-compressed when the name ends in .gz.
+    mode is "w" for text (UTF-8) or "wb" for bytes.
+    """
+    if filename.endswith(".gz"):
+        raw = gzip.open(filename, "wb", compresslevel=3)
+        if mode == "wb":
+            return raw
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    if mode == "wb":
+        return open(filename, "wb", buffering=OUTPUT_BUFFER_SIZE)
+    return open(filename, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE)
+
+
+def _stanza_transform(content: str) -> str:
+    """
+    Replace each run of bare <line> lines with a single <stanza> line.
+    Single linear pass equivalent to re.sub(r"(\\n<line>)+\\n", "\\n<stanza>\\n"):
+    the first line never starts a run, and a run reaching the last line
+    keeps its final <line>.
+    """
+    lines = content.split("\n")
+    if "<line>" not in lines:
+        return content
+
+    out = []
+    run = 0
+    for index, line in enumerate(lines):
+        if line == "<line>" and index > 0:
+            run += 1
+            continue
+        if run:
+            out.append("<stanza>")
+            run = 0
+        out.append(line)
+
+    if run:
+        if run > 1:
+            out.append("<stanza>")
+        out.append("<line>")
+    return "\n".join(out)
+
+
+def _spaces(count: int) -> str:
+    """A string of count spaces, from the prebuilt pool when short enough"""
+    return _SPACES[count] if count < len(_SPACES) else " " * count
+
+
+def _poem_text(poem: Dict[str, Any]) -> str:
+    """The block of the text output for one poem"""
+    # Replace consecutive <line> patterns with <stanza>
+    content = _stanza_transform(poem["content"])
+    return "".join(("<start_poem>\n", content, "\n<stanza>\n<end_poem>\n"))
+
+
+class PageCache:
+    """
+    On-disk cache of successfully fetched pages, one file per URL hash.
+    Lets reruns (e.g. while working on the parser) skip the network.
+    """
+
+    def __init__(
+        self, directory: str = DEFAULT_CACHE_DIR, expire_after: int = 7 * 24 * 3600
+    ):
+        self.directory = directory
+        self.expire_after = expire_after
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.html")
+
+    def get(self, url: str) -> bytes:
+        """Cached HTML of url, or None if missing or expired"""
+        path = self._path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.expire_after:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def set(self, url: str, html: bytes):
+        # Created on the first write, so building a scraper leaves no trace
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(url)
+        # Write to a private temp file first so concurrent fetches never
+        # observe a partially written page
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+
+
+class RateLimiter:
+    """
+    Thread-safe counterpart of AsyncLimiter: spaces acquire() calls
+    evenly so that at most `rate` of them pass per second.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
 
 class RabindraPoetryParser:
     """Parser for handling poem content with proper formatting"""
 
     @staticmethod
-    def remove_bengali_digits(text: str) -> str:
-        """Remove Bengali digits from text"""
-        bengali_digits = "০১২৩৪৫৬৭৮৯"
-        english_digits = "0123456789"
+    def parse_document(html: bytes) -> etree._Element:
+        """Build the document tree handed to the other parser methods"""
+        # Parse the UTF-8 bytes directly, without decoding the page to str
+        root = etree.fromstring(html, parser=_HTML_PARSER)
+        if root is None:
+            root = etree.fromstring(b"<html/>", parser=_HTML_PARSER)
+        return root
 
-        # Create translation table to remove Bengali and English digits
-        translation_table = str.maketrans("", "", bengali_digits + english_digits)
-        return text.translate(translation_table)
+    @staticmethod
+    def find_next_page_href(tree: etree._Element) -> str:
+        """Return the raw href of the 'পরবর্তী' (next page) link, if any"""
+        next_links = _NEXT_PAGE_XPATH(tree)
+        return str(next_links[0]) if next_links else None
 
     @staticmethod
+    def find_collection_anchors(tree: etree._Element) -> List[tuple]:
+        """Return (href, title) pairs for the links of a collection index page"""
+        if _LIST_TABLE_XPATH(tree):
+            anchors = _LIST_ANCHOR_XPATH(tree)
+        else:
+            anchors = _CONTENT_ANCHOR_XPATH(tree)
+
+        anchor_links = []
+        for anchor in anchors:
+            texts = _TEXT_XPATH(anchor)
+            anchor_links.append((anchor.get("href"), texts[0] if texts else None))
+        return anchor_links
+
+    @staticmethod
+    def remove_bengali_digits(text: str) -> str:
+        """Remove Bengali and English digits from text"""
+        return text.translate(_DIGITS_TRANS)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def process_line(line: str) -> str:
-        """Apply common processing to a line: remove digits, normalize, add punctuation spacing"""
-        # Remove Bengali and English digits
-        line = RabindraPoetryParser.remove_bengali_digits(line)
+        """
+        Apply common processing to a line: remove digits, normalize, add punctuation spacing.
+        Memoized, as refrains and short lines repeat across poems.
+        """
+        # Remove digits and add spacing around punctuation in one pass; the
+        # digits still go before normalization, as they can separate the two
+        # halves of a vowel sign
+        line = line.translate(_PROCESS_TRANS)
         # Check if line is empty after digit removal
         if not line.strip():
             return None
-        # Unicode normalization
-        line = unicodedata.normalize("NFC", line)
-        # Add spacing around punctuation
-        line = re.sub(r"([।?!,—])", r" \1 ", line)
-        return line
+        # normalize() runs the NFC quick check itself and returns the line
+        # unchanged when it is already normalized
+        return unicodedata.normalize("NFC", line)
 
     @staticmethod
-    def extract_text_with_spacing(element: parsel.Selector) -> str:
+    def process_lines(lines: List[str]) -> List[str]:
+        """
+        Batch version of process_line: the lines are joined with a record
+        separator, normalized and punctuation-spaced in one pass, and split
+        again. The separator is a non-composing starter, so the result
+        matches processing each line on its own.
+        """
+        page = _LINE_SEP.join(lines)
+        if page.count(_LINE_SEP) != len(lines) - 1:
+            # A line contains the separator itself, fall back to per-line
+            return [RabindraPoetryParser.process_line(line) for line in lines]
+
+        page = unicodedata.normalize("NFC", page.translate(_PROCESS_TRANS))
+        return [line if line.strip() else None for line in page.split(_LINE_SEP)]
+
+    @staticmethod
+    def finish_lines(raw_lines: List[str]) -> List[str]:
+        """
+        Process the raw lines of a page and append the <line> markers.
+        None entries are stanza breaks and become a bare <line>.
+        """
+        processed = iter(
+            RabindraPoetryParser.process_lines(
+                [line for line in raw_lines if line is not None]
+            )
+        )
+        lines = []
+        for raw_line in raw_lines:
+            if raw_line is None:
+                lines.append("<line>")
+                continue
+            processed_line = next(processed)
+            if processed_line is not None:
+                lines.append(processed_line + "<line>")
+        return lines
+
+    @staticmethod
+    def extract_text_with_spacing(root: etree._Element) -> str:
         """
         Extract text from an element while preserving spaces represented
         by <font>&nbsp;</font> or inline &nbsp;, but without introducing
         artificial line breaks inside a <p>.
         """
-        pieces = []
-        for node in element.xpath("./node()"):
-            tag = node.root.tag if hasattr(node.root, "tag") else None
-
-            if tag is None:  # text node
-                text_val = node.get()
-                if text_val:
-                    pieces.append(
-                        text_val.replace("\xa0", " ")
-                        .replace("&nbsp;", " ")
-                        .replace("\n", " ")
-                    )
+        # Pieces of every open element; elements other than <font> and <br>
+        # are finished as a line of their own when they close. lxml's HTML
+        # parser already lowercases tag names
+        stack = []
+        walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+        for event, node in walker:
+            if event == "start":
+                tag = node.tag
+                if tag == "font" and node is not root:
+                    nbsp_count = "".join(node.itertext()).count("\xa0")
+                    if nbsp_count > 0:
+                        stack[-1].append(_spaces(nbsp_count))
+                    walker.skip_subtree()
+                elif tag == "br" and node is not root:
+                    stack[-1].append("<line>\n")
+                else:
+                    stack.append([])
+                    if node.text:
+                        stack[-1].append(RabindraPoetryParser._spaced_text(node.text))
+                continue
 
-            elif tag.lower() == "font":
-                inner_text = "".join(node.xpath(".//text()").getall())
-                nbsp_count = inner_text.count("\xa0") + inner_text.count("&nbsp;")
-                if nbsp_count > 0:
-                    pieces.append(" " * nbsp_count)
+            if event == "end" and (node is root or node.tag not in ("font", "br")):
+                sub_text = RabindraPoetryParser._finish_spaced_line(stack.pop())
+                if node is root:
+                    return sub_text
+                if sub_text:
+                    stack[-1].append(sub_text)
 
-            elif tag.lower() == "br":
-                pieces.append("<line>\n")
+            # Text following a closed element, comment or processing instruction
+            if node.tail:
+                stack[-1].append(RabindraPoetryParser._spaced_text(node.tail))
 
-            else:
-                sub_text = RabindraPoetryParser.extract_text_with_spacing(node)
-                if sub_text:
-                    pieces.append(sub_text)
+    @staticmethod
+    def _spaced_text(text_val: str) -> str:
+        """Turn nbsp and native newlines of a text node into plain spaces"""
+        return text_val.translate(_NBSP_TRANS)
 
+    @staticmethod
+    def _finish_spaced_line(pieces: List[str]) -> str:
+        """Join the pieces of an element into a processed line, or None if empty"""
         line = "".join(pieces)
-        line = re.sub(r"\n+", "\n", line)
+        line = _RE_NL.sub("\n", line)
         line = line.rstrip()
         processed_line = RabindraPoetryParser.process_line(line)
 
@@ -81,19 +366,25 @@ class RabindraPoetryParser:
 
         return processed_line + "<line>"
 
+    @classmethod
+    def parse_poem_content(cls, tree: etree._Element) -> str:
+        """Parse the poem content of a page into a single string"""
+        return "\n".join(cls.parse_poem_lines(tree))
+
     @staticmethod
-    def parse_poem_content(selector: parsel.Selector) -> str:
-        """Parse poem content handling both scenarios (p tags, br tags, or combination)"""
-        kobita_divs = selector.xpath('//div[contains(@id, "kobita")]')
+    def parse_poem_lines(tree: etree._Element) -> List[str]:
+        """Parse poem lines handling both scenarios (p tags, br tags, or combination)"""
+        kobita_divs = _KOBITA_XPATH(tree)
         if not kobita_divs:
-            return ""
+            return []
         kobita_div = kobita_divs[0]
 
-        p_tags = kobita_div.xpath(".//p")
-        br_tags = kobita_div.xpath(".//br")
+        p_tags = _P_XPATH(kobita_div)
+        # Only whether there is any <br> matters, so stop at the first one
+        has_br = next(kobita_div.iter("br"), None) is not None
 
         # Check if we have a combination of p tags and br tags
-        if p_tags and br_tags:
+        if p_tags and has_br:
             return RabindraPoetryParser.parse_combined_content(kobita_div)
         elif p_tags:
             # Pure p tag scenario
@@ -101,472 +392,1047 @@ class RabindraPoetryParser:
             for p_tag in p_tags:
                 line_content = RabindraPoetryParser.extract_text_with_spacing(p_tag)
 
+                # Lines end in <line>, so there is no trailing space to strip
                 if line_content:
-                    clean_line = line_content.replace("\n", "").rstrip()
-                    if clean_line.strip():
-                        lines.append(clean_line)
-                    elif clean_line.strip() == "":
-                        lines.append("")
+                    lines.append(line_content.replace("\n", ""))
 
-            return "\n".join(lines)
+            return lines
         else:
             # Handle br tag scenario - split content by br tags
             return RabindraPoetryParser.parse_br_content(kobita_div)
 
     @staticmethod
-    def parse_combined_content(kobita_div: parsel.Selector) -> str:
+    def _finish_line(parts: List[str], raw_lines: List[str]):
+        """
+        Join the accumulated parts of a line, queue it for processing and
+        empty parts for the next line. Only the right side is stripped to
+        preserve leading spaces, and whitespace-only lines are dropped.
+        """
+        if not parts:
+            return
+        line = "".join(parts).rstrip()
+        if line:
+            raw_lines.append(line)
+        parts.clear()
+
+    @staticmethod
+    def _combined_text(text_val: str, line_parts: List[str], raw_lines: List[str]):
+        """Text node directly inside the kobita div or a <p>"""
+        if text_val:
+            clean_text = text_val.translate(_NBSP_STRIP_TRANS)
+            if clean_text:  # Keep all text including whitespace
+                line_parts.append(clean_text)
+
+    @staticmethod
+    def _combined_p(child: etree._Element, line_parts: List[str], raw_lines: List[str]):
+        """<p> tag: a stanza break when empty, otherwise lines split at <br>"""
+        # First, finalize any pending line parts from before this p tag
+        RabindraPoetryParser._finish_line(line_parts, raw_lines)
+
+        # Check if this is an empty p tag (stanza break) or contains content
+        # str.strip() also strips \xa0, so nbsp-only tags come out empty
+        p_text = "".join(_TEXT_XPATH(child)).strip()
+
+        if not p_text:  # Empty p tag - indicates stanza break
+            raw_lines.append(None)
+            return
+
+        # P tag with content - may contain br tags for line breaks
+        # Need to parse the content within the p tag for br tags
+        current_p_line = []
+
+        # Process all nodes within the p tag: the text before the first
+        # child, then each child element followed by its tail text
+        RabindraPoetryParser._combined_text(child.text, current_p_line, raw_lines)
+        for p_node in child:
+            p_tag = p_node.tag
+
+            if p_tag == "font":
+                # Handle font tags within p
+                RabindraPoetryParser._combined_font(p_node, current_p_line, raw_lines)
+
+            elif p_tag == "br":
+                # BR within p tag - finalize current line
+                RabindraPoetryParser._finish_line(current_p_line, raw_lines)
+
+            RabindraPoetryParser._combined_text(p_node.tail, current_p_line, raw_lines)
+
+        # Add any remaining content in the p tag
+        RabindraPoetryParser._finish_line(current_p_line, raw_lines)
+
+    @staticmethod
+    def _combined_br(
+        child: etree._Element, line_parts: List[str], raw_lines: List[str]
+    ):
+        """<br> tag: finalize the current line"""
+        RabindraPoetryParser._finish_line(line_parts, raw_lines)
+
+    @staticmethod
+    def _combined_font(
+        child: etree._Element, line_parts: List[str], raw_lines: List[str]
+    ):
+        """<font> tag: nbsp spacing, or the text it contains"""
+        inner_text = "".join(_TEXT_XPATH(child))
+        inner_text = inner_text.translate(_NEWLINE_STRIP_TRANS)
+        nbsp_count = inner_text.count("\xa0")
+        if nbsp_count > 0:
+            line_parts.append(_spaces(nbsp_count))
+        elif inner_text.strip():
+            line_parts.append(inner_text)
+
+    # Handlers of the elements directly inside the kobita div, called with
+    # (element, parts of the current line, raw lines); other tags are ignored
+    _COMBINED_HANDLERS = {
+        "p": _combined_p,
+        "br": _combined_br,
+        "font": _combined_font,
+    }
+
+    @staticmethod
+    def parse_combined_content(kobita_div: etree._Element) -> List[str]:
         """Parse poem content that contains both p tags and br tags"""
-        lines = []
+        # Raw lines are processed together once the whole div is read
+        raw_lines = []
         current_line_parts = []
+        handlers = RabindraPoetryParser._COMBINED_HANDLERS
 
-        # Process all direct children of the kobita div
-        for child in kobita_div.xpath("./node()"):
-            tag = child.root.tag if hasattr(child.root, "tag") else None
-
-            if tag is None:  # text node
-                text_val = child.get()
-                if text_val:
-                    clean_text = text_val.replace("\n", "").replace("\r", "")
-                    clean_text = clean_text.replace("\xa0", " ").replace("&nbsp;", " ")
-                    if clean_text:  # Keep all text including whitespace
-                        current_line_parts.append(clean_text)
-
-            elif tag.lower() == "p":
-                # First, finalize any pending line parts from before this p tag
-                if current_line_parts:
-                    line = "".join(current_line_parts).rstrip()
-                    if line.strip():
-                        processed_line = RabindraPoetryParser.process_line(line)
-                        if processed_line is not None:
-                            lines.append(processed_line + "<line>")
-                    current_line_parts = []
-
-                # Check if this is an empty p tag (stanza break) or contains content
-                p_text = "".join(child.xpath(".//text()").getall()).strip()
-                p_text = p_text.replace("\xa0", "").replace("&nbsp;", "")
-
-                if not p_text:  # Empty p tag - indicates stanza break
-                    # Add stanza break - use a placeholder that will be recognized
-                    lines.append("<stanza_break>")
-                else:
-                    # P tag with content - may contain br tags for line breaks
-                    # Need to parse the content within the p tag for br tags
-                    current_p_line = []
-
-                    # Process all nodes within the p tag
-                    for p_node in child.xpath("./node()"):
-                        p_tag = p_node.root.tag if hasattr(p_node.root, "tag") else None
-
-                        if p_tag is None:  # text node within p
-                            text_val = p_node.get()
-                            if text_val:
-                                clean_text = text_val.replace("\n", "").replace(
-                                    "\r", ""
-                                )
-                                clean_text = clean_text.replace("\xa0", " ").replace(
-                                    "&nbsp;", " "
-                                )
-                                if clean_text:
-                                    current_p_line.append(clean_text)
-
-                        elif p_tag.lower() == "font":
-                            # Handle font tags within p
-                            inner_text = "".join(p_node.xpath(".//text()").getall())
-                            inner_text = inner_text.replace("\n", "").replace("\r", "")
-                            nbsp_count = inner_text.count("\xa0") + inner_text.count(
-                                "&nbsp;"
-                            )
-                            if nbsp_count > 0:
-                                current_p_line.append(" " * nbsp_count)
-                            elif inner_text.strip():
-                                clean_text = inner_text.replace("\xa0", " ").replace(
-                                    "&nbsp;", " "
-                                )
-                                if clean_text.strip():
-                                    current_p_line.append(clean_text)
-
-                        elif p_tag.lower() == "br":
-                            # BR within p tag - finalize current line
-                            if current_p_line:
-                                line = "".join(current_p_line).rstrip()
-                                if line.strip():
-                                    processed_line = RabindraPoetryParser.process_line(
-                                        line
-                                    )
-                                    if processed_line is not None:
-                                        lines.append(processed_line + "<line>")
-                                current_p_line = []
-
-                    # Add any remaining content in the p tag
-                    if current_p_line:
-                        line = "".join(current_p_line).rstrip()
-                        if line.strip():
-                            processed_line = RabindraPoetryParser.process_line(line)
-                            if processed_line is not None:
-                                lines.append(processed_line + "<line>")
-
-            elif tag.lower() == "br":
-                # BR tag represents line break - finalize current line
-                if current_line_parts:
-                    line = "".join(
-                        current_line_parts
-                    ).rstrip()  # Only strip right side to preserve leading spaces
-                    if (
-                        line.strip()
-                    ):  # Check if there's actual content after stripping both sides
-                        processed_line = RabindraPoetryParser.process_line(line)
-                        if processed_line is not None:
-                            lines.append(processed_line + "<line>")
-                    current_line_parts = []
-
-            elif tag.lower() == "font":
-                # Handle font tags that might contain spacing or text
-                inner_text = "".join(child.xpath(".//text()").getall())
-                inner_text = inner_text.replace("\n", "").replace("\r", "")
-                nbsp_count = inner_text.count("\xa0") + inner_text.count("&nbsp;")
-                if nbsp_count > 0:
-                    current_line_parts.append(" " * nbsp_count)
-                elif inner_text.strip():
-                    clean_text = inner_text.replace("\xa0", " ").replace("&nbsp;", " ")
-                    if clean_text.strip():
-                        current_line_parts.append(clean_text)
+        # Process all direct children of the kobita div, with the text
+        # before the first one and after each one taken from text and tail
+        RabindraPoetryParser._combined_text(
+            kobita_div.text, current_line_parts, raw_lines
+        )
+        for child in kobita_div:
+            # Processing instructions have a non-string tag and no handler
+            handler = handlers.get(child.tag)
+            if handler is not None:
+                handler(child, current_line_parts, raw_lines)
+            RabindraPoetryParser._combined_text(
+                child.tail, current_line_parts, raw_lines
+            )
 
         # Add any remaining content as the last line
-        if current_line_parts:
-            line = "".join(current_line_parts).rstrip()
-            if line.strip():
-                processed_line = RabindraPoetryParser.process_line(line)
-                if processed_line is not None:
-                    lines.append(processed_line + "<line>")
-
-        # Post-process to handle stanza breaks properly
-        final_lines = []
-        for line in lines:
-            if line == "<stanza_break>":
-                final_lines.append("<line>")  # Add <line> tag for stanza break
-            else:
-                final_lines.append(line)
+        RabindraPoetryParser._finish_line(current_line_parts, raw_lines)
 
-        return "\n".join(final_lines)
+        return RabindraPoetryParser.finish_lines(raw_lines)
 
     @staticmethod
-    def parse_br_content(kobita_div: parsel.Selector) -> str:
+    def parse_br_content(root: etree._Element) -> List[str]:
         """Parse poem content that uses br tags as line separators"""
-        lines = []
+        # Raw lines are processed together once the whole div is read
+        raw_lines = []
         current_line_parts = []
 
-        # Get all child nodes (text and elements)
-        for node in kobita_div.xpath("./node()"):
-            tag = node.root.tag if hasattr(node.root, "tag") else None
-
-            if tag is None:  # text node
-                text_val = node.get()
-                if text_val:
-                    # Strip native newlines but preserve other spacing
-                    clean_text = text_val.replace("\n", "").replace("\r", "")
-                    clean_text = clean_text.replace("\xa0", " ").replace("&nbsp;", " ")
-                    if clean_text:  # Only add if there's actual content after cleaning
-                        current_line_parts.append(clean_text)
-
-            elif tag.lower() == "font":
+        def add_text(text_val):
+            if text_val:
+                # Strip native newlines but preserve other spacing
+                clean_text = text_val.translate(_NBSP_STRIP_TRANS)
+                if clean_text:  # Only add if there's actual content after cleaning
+                    current_line_parts.append(clean_text)
+
+        # Walk the lxml children directly: text before the first child is
+        # root.text, and the text after each child is that child's tail
+        add_text(root.text)
+        for node in root:
+            # Tag names come lowercased from lxml's HTML parser
+            tag = node.tag
+
+            if tag == "font":
                 # Handle font tags that might contain nbsp - preserve spacing exactly
-                inner_text = "".join(node.xpath(".//text()").getall())
+                inner_text = "".join(node.itertext())
                 # Strip native newlines from font content too
-                inner_text = inner_text.replace("\n", "").replace("\r", "")
-                nbsp_count = inner_text.count("\xa0") + inner_text.count("&nbsp;")
+                inner_text = inner_text.translate(_NEWLINE_STRIP_TRANS)
+                nbsp_count = inner_text.count("\xa0")
                 if nbsp_count > 0:
-                    current_line_parts.append(" " * nbsp_count)
+                    current_line_parts.append(_spaces(nbsp_count))
                 else:
                     # Regular text in font tag
                     if inner_text:
-                        clean_text = inner_text.replace("\xa0", " ").replace(
-                            "&nbsp;", " "
-                        )
-                        if clean_text:
-                            current_line_parts.append(clean_text)
+                        current_line_parts.append(inner_text)
 
-            elif tag.lower() == "br":
+            elif tag == "br":
                 # End current line and start new one - only add line break here
-                if current_line_parts:
-                    line = "".join(current_line_parts).rstrip()
-                    if line:  # Only add non-empty lines
-                        # Apply processing to the line before adding to array
-                        processed_line = RabindraPoetryParser.process_line(line)
-                        if processed_line is not None:
-                            lines.append(processed_line + "<line>")
-                    current_line_parts = []
+                RabindraPoetryParser._finish_line(current_line_parts, raw_lines)
+
+            # Comments and processing instructions only contribute their tail
+            add_text(node.tail)
 
         # Add any remaining content as the last line
-        if current_line_parts:
-            line = "".join(current_line_parts).rstrip()
-            if line:
-                # Apply processing to the line before adding to array
-                processed_line = RabindraPoetryParser.process_line(line)
-                if processed_line is not None:
-                    lines.append(processed_line + "<line>")
+        RabindraPoetryParser._finish_line(current_line_parts, raw_lines)
 
-        return "\n".join(lines)
+        return RabindraPoetryParser.finish_lines(raw_lines)
 
 
-class RabindraPoetryaScraper:
-    def __init__(self, base_url: str = "https://rabindra-rachanabali.nltr.org"):
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
+class LexborPoetryParser(RabindraPoetryParser):
+    """
+    RabindraPoetryParser implemented on selectolax's Lexbor HTML parser.
+    Walks the C-level node tree instead of evaluating XPath per node and
+    is meant to produce the same output as the lxml parser.
+    """
+
+    @staticmethod
+    def parse_document(html: bytes) -> "LexborHTMLParser":
+        """Build the document tree handed to the other parser methods"""
+        return LexborHTMLParser(html)
+
+    @staticmethod
+    def _first_text(node) -> str:
+        """First descendant text node, like the first match of .//text()"""
+        for child in node.traverse(include_text=True):
+            if child.tag == "-text":
+                return child.text_content
+        return None
+
+    @staticmethod
+    def find_next_page_href(tree: "LexborHTMLParser") -> str:
+        """Return the raw href of the 'পরবর্তী' (next page) link, if any"""
+        for anchor in tree.css("a[href]"):
+            # XPath contains() only looks at the first descendant text node
+            text = LexborPoetryParser._first_text(anchor)
+            if text and "পরবর্তী" in text:
+                return anchor.attributes.get("href") or ""
+        return None
+
+    @staticmethod
+    def find_collection_anchors(tree: "LexborHTMLParser") -> List[tuple]:
+        """Return (href, title) pairs for the links of a collection index page"""
+        anchors = tree.css('table[class="list"] a[href]')
+        if not tree.css_first('table[class="list"]'):
+            anchors = tree.css('div[class*="content"] a[href]')
+
+        return [
+            (anchor.attributes.get("href"), LexborPoetryParser._first_text(anchor))
+            for anchor in anchors
+        ]
+
+    @staticmethod
+    def extract_text_with_spacing(element) -> str:
+        """
+        Extract text from an element while preserving spaces represented
+        by <font>&nbsp;</font> or inline &nbsp;, but without introducing
+        artificial line breaks inside a <p>.
+        """
+        # (remaining children, pieces) of every open element; nested
+        # elements are finished as a line of their own once exhausted
+        stack = [(element.iter(include_text=True), [])]
+        while stack:
+            nodes, pieces = stack[-1]
+            for node in nodes:
+                tag = node.tag
+
+                if tag == "-text":
+                    text_val = node.text_content
+                    if text_val:
+                        pieces.append(text_val.translate(_NBSP_TRANS))
+
+                elif tag == "font":
+                    nbsp_count = node.text(deep=True).count("\xa0")
+                    if nbsp_count > 0:
+                        pieces.append(_spaces(nbsp_count))
+
+                elif tag == "br":
+                    pieces.append("<line>\n")
+
+                elif not tag.startswith("-"):  # skip comments
+                    stack.append((node.iter(include_text=True), []))
+                    break
+            else:
+                stack.pop()
+                sub_text = RabindraPoetryParser._finish_spaced_line(pieces)
+                if not stack:
+                    return sub_text
+                if sub_text:
+                    stack[-1][1].append(sub_text)
+
+    @staticmethod
+    def parse_poem_lines(tree: "LexborHTMLParser") -> List[str]:
+        """Parse poem lines handling both scenarios (p tags, br tags, or combination)"""
+        kobita_div = tree.css_first('div[id*="kobita"]')
+        if kobita_div is None:
+            return []
+
+        p_tags = kobita_div.css("p")
+        has_br = kobita_div.css_first("br") is not None
+
+        if p_tags and has_br:
+            return LexborPoetryParser.parse_combined_content(kobita_div)
+        elif p_tags:
+            lines = []
+            for p_tag in p_tags:
+                line_content = LexborPoetryParser.extract_text_with_spacing(p_tag)
+
+                # Lines end in <line>, so there is no trailing space to strip
+                if line_content:
+                    lines.append(line_content.replace("\n", ""))
+
+            return lines
+        else:
+            return LexborPoetryParser.parse_br_content(kobita_div)
+
+    @staticmethod
+    def _font_text(node) -> str:
+        """Spacing or text contributed by a <font> tag inside a line"""
+        inner_text = node.text(deep=True).translate(_NEWLINE_STRIP_TRANS)
+        nbsp_count = inner_text.count("\xa0")
+        if nbsp_count > 0:
+            return _spaces(nbsp_count)
+        return inner_text if inner_text.strip() else None
+
+    @staticmethod
+    def _clean_text(text_val: str) -> str:
+        return text_val.translate(_NBSP_STRIP_TRANS)
+
+    @staticmethod
+    def parse_combined_content(kobita_div) -> List[str]:
+        """Parse poem content that contains both p tags and br tags"""
+        raw_lines = []
+        current_line_parts = []
+
+        for child in kobita_div.iter(include_text=True):
+            tag = child.tag
+
+            if tag == "-text":
+                clean_text = LexborPoetryParser._clean_text(child.text_content or "")
+                if clean_text:
+                    current_line_parts.append(clean_text)
+
+            elif tag == "p":
+                LexborPoetryParser._finish_line(current_line_parts, raw_lines)
+
+                p_text = child.text(deep=True).strip()
+
+                if not p_text:  # Empty p tag - indicates stanza break
+                    raw_lines.append(None)
+                    continue
+
+                current_p_line = []
+                for p_node in child.iter(include_text=True):
+                    p_tag = p_node.tag
+
+                    if p_tag == "-text":
+                        clean_text = LexborPoetryParser._clean_text(
+                            p_node.text_content or ""
+                        )
+                        if clean_text:
+                            current_p_line.append(clean_text)
+
+                    elif p_tag == "font":
+                        font_text = LexborPoetryParser._font_text(p_node)
+                        if font_text:
+                            current_p_line.append(font_text)
+
+                    elif p_tag == "br":
+                        LexborPoetryParser._finish_line(current_p_line, raw_lines)
+
+                LexborPoetryParser._finish_line(current_p_line, raw_lines)
+
+            elif tag == "br":
+                LexborPoetryParser._finish_line(current_line_parts, raw_lines)
+
+            elif tag == "font":
+                font_text = LexborPoetryParser._font_text(child)
+                if font_text:
+                    current_line_parts.append(font_text)
+
+        LexborPoetryParser._finish_line(current_line_parts, raw_lines)
+
+        return RabindraPoetryParser.finish_lines(raw_lines)
+
+    @staticmethod
+    def parse_br_content(kobita_div) -> List[str]:
+        """Parse poem content that uses br tags as line separators"""
+        raw_lines = []
+        current_line_parts = []
+
+        for node in kobita_div.iter(include_text=True):
+            tag = node.tag
+
+            if tag == "-text":
+                clean_text = LexborPoetryParser._clean_text(node.text_content or "")
+                if clean_text:
+                    current_line_parts.append(clean_text)
+
+            elif tag == "font":
+                inner_text = node.text(deep=True).translate(_NEWLINE_STRIP_TRANS)
+                nbsp_count = inner_text.count("\xa0")
+                if nbsp_count > 0:
+                    current_line_parts.append(_spaces(nbsp_count))
+                elif inner_text:
+                    current_line_parts.append(inner_text)
+
+            elif tag == "br":
+                LexborPoetryParser._finish_line(current_line_parts, raw_lines)
+
+        LexborPoetryParser._finish_line(current_line_parts, raw_lines)
+
+        return RabindraPoetryParser.finish_lines(raw_lines)
+
+
+PARSER_BACKENDS = {
+    "lxml": RabindraPoetryParser,
+    "lexbor": LexborPoetryParser,
+}
+
+
+def create_parser(backend: str = "lxml") -> RabindraPoetryParser:
+    """Instantiate the poem parser for the given backend name"""
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {backend!r}, expected one of {sorted(PARSER_BACKENDS)}"
         )
-        self.parser = RabindraPoetryParser()
+    if backend == "lexbor" and LexborHTMLParser is None:
+        raise ImportError(
+            "The 'lexbor' parser backend requires selectolax (uv sync --extra lexbor)"
+        )
+    return PARSER_BACKENDS[backend]()
+
+
+class RabindraScraperBase:
+    """
+    I/O-free parts shared by RabindraPoetryaScraper and AsyncRabindraScraper:
+    cache and parser setup, URL handling, poem records and output files.
+    Subclasses add the session and the fetching and scraping methods.
+    """
+
+    # Second line of defence against pagination loops the visited set misses
+    MAX_PAGES_PER_POEM = 100
+
+    def __init__(
+        self,
+        base_url: str,
+        parser_backend: str,
+        cache_dir: str,
+        max_concurrent_poems: int,
+        rate_limiter,
+    ):
+        self.base_url = base_url
+        # Pass cache_dir=None to always hit the network
+        self.cache = PageCache(cache_dir) if cache_dir else None
+        self.max_concurrent_poems = max_concurrent_poems
+        # Paces every request to the site, however many poems are in flight
+        self.rate_limiter = rate_limiter
+        self.parser = create_parser(parser_backend)
+
+    def _cached_page(self, url: str) -> bytes:
+        """Cached HTML of url, or None when caching is off or it is missing"""
+        if self.cache is None:
+            return None
+        return self.cache.get(url)
 
     def process_stanzas(self, content: str) -> str:
         """
         Process poem content to insert stanza markers where there are consecutive newlines.
         Replaces multiple consecutive newlines with stanza markers.
         """
-        import re
-
         # Find sequences of 2 or more consecutive newlines
         # Replace them with stanza markers
-        stanza_count = 1
+        stanza_numbers = itertools.count(1)
 
         def replace_with_stanza(match):
-            nonlocal stanza_count
             newlines = match.group(0)
             # Keep first and last newline, insert stanza marker in between
-            if len(newlines) >= 2:
-                result = newlines[0] + f"<stanza{stanza_count}>" + newlines[-1]
-                stanza_count += 1
-                return result
-            return newlines
+            return newlines[0] + f"<stanza{next(stanza_numbers)}>" + newlines[-1]
 
         # Pattern to match 2 or more consecutive newlines
-        processed_content = re.sub(r"\n{2,}", replace_with_stanza, content)
+        processed_content = _RE_MULTI_NL.sub(replace_with_stanza, content)
 
         return processed_content
 
-    def get_page(self, url: str) -> parsel.Selector:
-        try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return parsel.Selector(text=response.text)
-        except requests.RequestException as e:
-            print(f"Error fetching {url}: {e}")
-            return None
+    def get_collection_url(self, subcatid: int, catid: int = 7) -> str:
+        return f"{self.base_url}/node/4?subcatid={subcatid}&catId={catid}"
 
-    def get_collection_poems(
-        self, subcatid: int, catid: int = 7
+    def extract_poem_links(
+        self, tree: etree._Element, subcatid: int
     ) -> List[Dict[str, str]]:
-        url = f"{self.base_url}/node/4?subcatid={subcatid}&catId={catid}"
-        print(f"Fetching collection {subcatid}...")
-
-        selector = self.get_page(url)
-        if not selector:
-            return []
-
+        """Collect poem titles and absolute URLs from a collection index page"""
         poem_links = []
-        list_table = selector.xpath('//table[@class="list"]')
-
-        if list_table:
-            anchors = list_table.xpath(".//a[@href]")
-        else:
-            anchors = selector.xpath('//div[contains(@class, "content")]//a[@href]')
-
-        for anchor in anchors:
-            href = anchor.xpath("./@href").get()
-            title = anchor.xpath(".//text()").get()
 
+        for href, title in self.parser.find_collection_anchors(tree):
             if href and title and "/node/" in href:
                 full_url = urljoin(self.base_url, href)
                 poem_links.append(
                     {"title": title.strip(), "url": full_url, "collection_id": subcatid}
                 )
 
-        print(f"Found {len(poem_links)} poems in collection {subcatid}")
+        logger.info("Found %d poems in collection %s", len(poem_links), subcatid)
         return poem_links
 
-    def get_next_page_url(self, selector: parsel.Selector) -> str:
-        """Find the next page URL by looking for the 'পরবর্তী' link"""
+    def get_next_page_url(self, tree: etree._Element, html: bytes = None) -> str:
+        """
+        Find the next page URL by looking for the 'পরবর্তী' link.
+        When the page's HTML is given, pages without the word at all
+        (typically the last page of a poem) skip the tree search.
+        """
+        if html is not None and _NEXT_WORD not in html:
+            return None
+
         # Look for anchor tag containing "পরবর্তী" text
-        next_links = selector.xpath('//a[contains(.//text(), "পরবর্তী")]/@href').getall()
-        if next_links:
+        next_url = self.parser.find_next_page_href(tree)
+        if next_url is not None:
             # Return the first next link found, making it absolute
-            next_url = next_links[0]
-            if next_url.startswith("/"):
-                return urljoin(self.base_url, next_url)
-            return next_url
+            return self._absolute_url(next_url)
+        return None
+
+    def guess_next_page_url(self, html: bytes) -> str:
+        """Find the likely next page URL with a regex, without parsing the page"""
+        match = _RE_NEXT_HREF.search(html)
+        if match:
+            href = match.group(1).decode("utf-8", "replace")
+            return self._absolute_url(html_lib.unescape(href))
         return None
 
+    def _absolute_url(self, href: str) -> str:
+        if href.startswith("/"):
+            return urljoin(self.base_url, href)
+        return href
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Canonical form of a URL for cycle detection: sorted query, no fragment"""
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+        )
+
+    def has_next_page(self, next_url: str, visited: set, page_count: int) -> bool:
+        """Whether pagination should continue to next_url"""
+        if not next_url or self.normalize_url(next_url) in visited:
+            return False
+        if page_count >= self.MAX_PAGES_PER_POEM:
+            logger.warning("  Stopping after %d pages", page_count)
+            return False
+        return True
+
+    def build_poem_data(
+        self, poem_info: Dict[str, str], poem_lines: List[str], page_count: int
+    ) -> Dict[str, Any]:
+        """Combine the parsed lines of all pages of a poem into its output record"""
+        # Pages are collected as one list of lines, so a single join
+        # builds the whole poem
+        combined_content = "\n".join(poem_lines)
+
+        # Process the combined content to add stanza markers
+        # processed_content = self.process_stanzas(combined_content)
+
+        return {
+            "title": poem_info["title"],
+            "url": poem_info["url"],
+            "collection_id": poem_info["collection_id"],
+            "content": combined_content,
+            "total_pages": page_count,
+        }
+
+    def save_poems(
+        self,
+        poems: List[Dict[str, Any]],
+        filename: str = "output/rabindra_poems.json.gz",
+    ):
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        with open_output(filename, "wb") as f:
+            f.write(orjson.dumps(poems, option=orjson.OPT_INDENT_2))
+
+        logger.info("Saved %d poems to %s", len(poems), filename)
+
+    def save_poems_text(
+        self,
+        poems: List[Dict[str, Any]],
+        filename: str = "output/rabindra_poems.txt.gz",
+    ):
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        with open_output(filename) as f:
+            for poem in poems:
+                # f.write(f"Title: {poem['title']}\n")
+                # f.write(f"Collection ID: {poem['collection_id']}\n")
+                # f.write(f"URL: {poem['url']}\n")
+                # f.write("-" * 50 + "\n")
+                f.write(_poem_text(poem))
+                # f.write("\n" + "=" * 80 + "\n\n")
+
+        logger.info("Saved %d poems to %s", len(poems), filename)
+
+    @contextlib.contextmanager
+    def _open_output_files(self, json_filename: str, txt_filename: str):
+        """
+        Open both output files for the whole run and yield (json_file, txt_file).
+        The JSON array is opened here and closed once the run finishes.
+        """
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(json_filename), exist_ok=True)
+        os.makedirs(os.path.dirname(txt_filename), exist_ok=True)
+
+        with contextlib.ExitStack() as stack:
+            json_file = stack.enter_context(open_output(json_filename, "wb"))
+            txt_file = stack.enter_context(open_output(txt_filename))
+            json_file.write(b"[\n")
+            yield json_file, txt_file
+            json_file.write(b"\n]")
+
+    def _append_poem_to_files(
+        self,
+        poem: Dict[str, Any],
+        json_file: BinaryIO,
+        txt_file: TextIO,
+        need_comma: bool,
+    ):
+        """Helper method to append a single poem to the open JSON and text files"""
+        # Append to JSON file
+        if need_comma:
+            json_file.write(b",\n")
+        json_file.write(orjson.dumps(poem, option=orjson.OPT_INDENT_2))
+
+        # Append to text file
+        txt_file.write(_poem_text(poem))
+
+
+class RabindraPoetryaScraper(RabindraScraperBase):
+    """Scraper built on a requests session, scraping poems on a thread pool"""
+
+    def __init__(
+        self,
+        base_url: str = "https://rabindra-rachanabali.nltr.org",
+        parser_backend: str = "lxml",
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_concurrent_poems: int = 8,
+        requests_per_second: float = 8,
+    ):
+        super().__init__(
+            base_url,
+            parser_backend,
+            cache_dir,
+            max_concurrent_poems,
+            RateLimiter(requests_per_second),
+        )
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        # Advertise every encoding urllib3 can decode here: gzip and deflate,
+        # plus br when Brotli is installed (uv sync --extra speedups)
+        self.session.headers.update(
+            {"Connection": "keep-alive", "Accept-Encoding": ACCEPT_ENCODING}
+        )
+        # Every request goes to the same host, so keep a warm connection pool
+        # and retry transient server errors instead of dropping the page
+        # The fetch pool runs a poem's current page and its prefetch at once
+        fetch_workers = 2 * max_concurrent_poems
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            # One pooled connection per fetch thread, so none get discarded
+            pool_maxsize=max(32, fetch_workers),
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=["GET"],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Downloads the next page of each poem in flight while the current
+        # one is parsed. A poem can hold two workers, its current page and a
+        # prefetch sleeping through its politeness delay, so sleeping
+        # prefetches never hold up other poems' first pages
+        self._fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def fetch_html(self, url: str, delay: float = 0) -> bytes:
+        """
+        Download a page after an optional politeness delay, None on failure.
+        Cached pages are returned immediately, without the delay.
+        The page is returned as the raw (UTF-8) bytes of the response.
+        """
+        html = self._cached_page(url)
+        if html is not None:
+            return html
+
+        if delay:
+            time.sleep(delay)
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("Error fetching %s: %s", url, e)
+            return None
+
+        if self.cache is not None:
+            self.cache.set(url, response.content)
+        return response.content
+
+    def get_page(self, url: str) -> etree._Element:
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        return self.parser.parse_document(html)
+
+    def get_collection_poems(
+        self, subcatid: int, catid: int = 7
+    ) -> List[Dict[str, str]]:
+        url = self.get_collection_url(subcatid, catid)
+        logger.info("Fetching collection %s...", subcatid)
+
+        tree = self.get_page(url)
+        if tree is None:
+            return []
+
+        return self.extract_poem_links(tree, subcatid)
+
     def scrape_poem(self, poem_info: Dict[str, str]) -> Dict[str, Any]:
-        print(f"Scraping: {poem_info['title']}")
+        logger.info("Scraping: %s", poem_info["title"])
 
-        all_content = []
+        poem_lines = []
         current_url = poem_info["url"]
         page_count = 1
 
+        visited = set()
+        pending = self._fetch_pool.submit(self.fetch_html, current_url)
+
         while current_url:
-            print(f"  Scraping page {page_count}: {current_url}")
+            logger.debug("  Scraping page %d: %s", page_count, current_url)
+            visited.add(self.normalize_url(current_url))
 
-            selector = self.get_page(current_url)
-            if not selector:
-                print(f"  Warning: Could not fetch page {page_count}")
+            html = pending.result()
+            if html is None:
+                logger.warning("  Could not fetch page %d", page_count)
                 break
 
-            page_content = self.parser.parse_poem_content(selector)
-            if page_content:
-                all_content.append(page_content)
+            # Start the download of the likely next page, then parse this one
+            # while it is in flight
+            guessed_url = self.guess_next_page_url(html)
+            prefetch = None
+            if (
+                guessed_url
+                and self.normalize_url(guessed_url) not in visited
+                and page_count < self.MAX_PAGES_PER_POEM
+            ):
+                prefetch = self._fetch_pool.submit(self.fetch_html, guessed_url, 0.5)
+
+            tree = self.parser.parse_document(html)
+            poem_lines.extend(self.parser.parse_poem_lines(tree))
+
+            next_url = self.get_next_page_url(tree, html)
 
-            next_url = self.get_next_page_url(selector)
+            if prefetch is not None and next_url != guessed_url:
+                # The guess was wrong, drop it and fetch the real next page
+                prefetch.cancel()
+                prefetch = None
 
-            if next_url and next_url != current_url:
+            if self.has_next_page(next_url, visited, page_count):
                 current_url = next_url
                 page_count += 1
-                time.sleep(0.5)
+                pending = prefetch or self._fetch_pool.submit(
+                    self.fetch_html, next_url, 0.5
+                )
             else:
                 break
 
-        print(f"  Completed scraping {page_count} page(s)")
-
-        # Combine all pages with page breaks
-        combined_content = (
-            "\n".join(all_content)
-            if len(all_content) > 1
-            else (all_content[0] if all_content else "")
-        )
+        logger.debug("  Completed scraping %d page(s)", page_count)
 
-        # Process the combined content to add stanza markers
-        # processed_content = self.process_stanzas(combined_content)
-
-        return {
-            "title": poem_info["title"],
-            "url": poem_info["url"],
-            "collection_id": poem_info["collection_id"],
-            "content": combined_content,
-            "total_pages": page_count,
-        }
+        return self.build_poem_data(poem_info, poem_lines, page_count)
 
     def scrape_collection(self, subcatid: int) -> List[Dict[str, Any]]:
         poem_links = self.get_collection_poems(subcatid)
-        poems = []
 
-        for poem_info in poem_links:
+        def scrape_or_log(poem_info):
             try:
-                poem_data = self.scrape_poem(poem_info)
-                if poem_data and poem_data["content"]:
-                    poems.append(poem_data)
-                time.sleep(1)
+                return self.scrape_poem(poem_info)
             except Exception as e:
-                print(f"Error scraping poem {poem_info['title']}: {e}")
-                continue
+                logger.error("Error scraping poem %s: %s", poem_info["title"], e)
+                return None
 
-        return poems
+        # Poems are scraped concurrently, paced by the shared rate limiter;
+        # map keeps them in collection order
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_poems) as pool:
+            results = list(pool.map(scrape_or_log, poem_links))
+
+        return [poem for poem in results if poem and poem["content"]]
 
     def scrape_all_collections(
         self,
         start_subcatid: int = 1,
         end_subcatid: int = 53,
-        json_filename: str = "output/rabindra_poems.json",
-        txt_filename: str = "output/rabindra_poems.txt",
+        json_filename: str = "output/rabindra_poems.json.gz",
+        txt_filename: str = "output/rabindra_poems.txt.gz",
     ) -> int:
         """
         Scrape all collections and write poems to files one by one.
         Returns the total number of poems scraped.
         """
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(json_filename), exist_ok=True)
-        os.makedirs(os.path.dirname(txt_filename), exist_ok=True)
-
         total_poems = 0
 
-        # Initialize JSON file with opening bracket
-        with open(json_filename, "w", encoding="utf-8") as json_file:
-            json_file.write("[\n")
+        with self._open_output_files(json_filename, txt_filename) as (
+            json_file,
+            txt_file,
+        ):
+            for subcatid in range(start_subcatid, end_subcatid + 1):
+                try:
+                    logger.info("--- Processing Collection %s ---", subcatid)
+                    collection_poems = self.scrape_collection(subcatid)
+
+                    # Write each poem immediately to both files
+                    for poem in collection_poems:
+                        self._append_poem_to_files(
+                            poem, json_file, txt_file, total_poems > 0
+                        )
+                        total_poems += 1
+                    json_file.flush()
+                    txt_file.flush()
+
+                    logger.info(
+                        "Scraped %d poems from collection %s",
+                        len(collection_poems),
+                        subcatid,
+                    )
+                    time.sleep(2)
+                except Exception as e:
+                    logger.error("Error processing collection %s: %s", subcatid, e)
+                    continue
+
+        logger.info("Total poems scraped: %d", total_poems)
+        return total_poems
+
 
-        # Initialize text file (empty)
-        with open(txt_filename, "w", encoding="utf-8") as txt_file:
-            pass
+class AsyncRabindraScraper(RabindraScraperBase):
+    """
+    Concurrent counterpart of RabindraPoetryaScraper built on aiohttp.
+    Poems of a collection are fetched in parallel, bounded by a semaphore,
+    while parsing stays synchronous and runs inline as pages arrive.
+    """
 
-        for subcatid in range(start_subcatid, end_subcatid + 1):
+    def __init__(
+        self,
+        base_url: str = "https://rabindra-rachanabali.nltr.org",
+        parser_backend: str = "lxml",
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_concurrent_poems: int = 16,
+        requests_per_second: float = 8,
+    ):
+        super().__init__(
+            base_url,
+            parser_backend,
+            cache_dir,
+            max_concurrent_poems,
+            AsyncLimiter(requests_per_second, 1.0),
+        )
+        self.session = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=16, keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the aiohttp session and its pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    @contextlib.asynccontextmanager
+    async def _session_scope(self):
+        """Reuse the open session, or open one for the duration of the call"""
+        if self.session is not None:
+            yield
+        else:
+            async with self:
+                yield
+
+    async def fetch_html(self, url: str, delay: float = 0) -> bytes:
+        """Awaitable RabindraPoetryaScraper.fetch_html, with the same retries"""
+        html = self._cached_page(url)
+        if html is not None:
+            return html
+
+        if delay:
+            await asyncio.sleep(delay)
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                # Same backoff as the Retry mounted on the sync session
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
             try:
-                print(f"\n--- Processing Collection {subcatid} ---")
-                collection_poems = self.scrape_collection(subcatid)
+                await self.rate_limiter.acquire()
+                async with self.session.get(url) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        continue
+                    response.raise_for_status()
+                    html = await response.read()
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < MAX_RETRIES and not isinstance(
+                    e, aiohttp.ClientResponseError
+                ):
+                    continue
+                logger.warning("Error fetching %s: %s", url, e)
+                return None
+
+        if self.cache is not None:
+            self.cache.set(url, html)
+        return html
+
+    async def get_page(self, url: str) -> etree._Element:
+        html = await self.fetch_html(url)
+        if html is None:
+            return None
+        return self.parser.parse_document(html)
 
-                # Write each poem immediately to both files
-                for i, poem in enumerate(collection_poems):
-                    self._append_poem_to_files(
-                        poem, json_filename, txt_filename, total_poems > 0
-                    )
-                    total_poems += 1
+    async def get_collection_poems(
+        self, subcatid: int, catid: int = 7
+    ) -> List[Dict[str, str]]:
+        url = self.get_collection_url(subcatid, catid)
+        logger.info("Fetching collection %s...", subcatid)
 
-                print(
-                    f"Scraped {len(collection_poems)} poems from collection {subcatid}"
-                )
-                time.sleep(2)
-            except Exception as e:
-                print(f"Error processing collection {subcatid}: {e}")
-                continue
+        tree = await self.get_page(url)
+        if tree is None:
+            return []
 
-        # Close JSON array
-        with open(json_filename, "a", encoding="utf-8") as json_file:
-            json_file.write("\n]")
+        return self.extract_poem_links(tree, subcatid)
 
-        print(f"\nTotal poems scraped: {total_poems}")
-        return total_poems
+    async def scrape_poem(self, poem_info: Dict[str, str]) -> Dict[str, Any]:
+        logger.info("Scraping: %s", poem_info["title"])
 
-    def save_poems(
-        self, poems: List[Dict[str, Any]], filename: str = "output/rabindra_poems.json"
-    ):
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        poem_lines = []
+        current_url = poem_info["url"]
+        page_count = 1
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(poems, f, ensure_ascii=False, indent=2)
+        visited = set()
 
-        print(f"\nSaved {len(poems)} poems to {filename}")
+        while current_url:
+            logger.debug("  Scraping page %d: %s", page_count, current_url)
+            visited.add(self.normalize_url(current_url))
 
-    def save_poems_text(
-        self, poems: List[Dict[str, Any]], filename: str = "output/rabindra_poems.txt"
-    ):
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+            # Wait between the pages of a poem, as the sync scraper does
+            html = await self.fetch_html(current_url, 0.5 if page_count > 1 else 0)
+            if html is None:
+                logger.warning("  Could not fetch page %d", page_count)
+                break
 
-        with open(filename, "w", encoding="utf-8") as f:
-            for poem in poems:
-                # f.write(f"Title: {poem['title']}\n")
-                # f.write(f"Collection ID: {poem['collection_id']}\n")
-                # f.write(f"URL: {poem['url']}\n")
-                # f.write("-" * 50 + "\n")
-                f.write("<start_poem>\n")
-                # Replace consecutive <line> patterns with <stanza>
-                content = poem["content"]
-                content = re.sub(r"(\n<line>)+\n", "\n<stanza>\n", content)
-                f.write(content)
-                f.write("\n<stanza>\n")
-                f.write("<end_poem>\n")
-                # f.write("\n" + "=" * 80 + "\n\n")
+            tree = self.parser.parse_document(html)
+            poem_lines.extend(self.parser.parse_poem_lines(tree))
 
-        print(f"Saved {len(poems)} poems to {filename}")
+            next_url = self.get_next_page_url(tree, html)
 
-    def _append_poem_to_files(
+            if self.has_next_page(next_url, visited, page_count):
+                current_url = next_url
+                page_count += 1
+            else:
+                break
+
+        logger.debug("  Completed scraping %d page(s)", page_count)
+
+        return self.build_poem_data(poem_info, poem_lines, page_count)
+
+    async def scrape_collection(self, subcatid: int) -> List[Dict[str, Any]]:
+        async with self._session_scope():
+            poem_links = await self.get_collection_poems(subcatid)
+            semaphore = asyncio.Semaphore(self.max_concurrent_poems)
+            return await self._scrape_poems(poem_links, semaphore)
+
+    async def _scrape_poems(
+        self, poem_links: List[Dict[str, str]], semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Scrape the given poems concurrently, at most one per semaphore slot"""
+
+        async def scrape_with_limit(poem_info):
+            async with semaphore:
+                try:
+                    poem_data = await self.scrape_poem(poem_info)
+                    await asyncio.sleep(1)
+                    return poem_data
+                except Exception as e:
+                    logger.error("Error scraping poem %s: %s", poem_info["title"], e)
+                    return None
+
+        results = await asyncio.gather(
+            *(scrape_with_limit(poem_info) for poem_info in poem_links)
+        )
+
+        return [poem for poem in results if poem and poem["content"]]
+
+    async def scrape_all_collections(
         self,
-        poem: Dict[str, Any],
-        json_filename: str,
-        txt_filename: str,
-        need_comma: bool,
-    ):
-        """Helper method to append a single poem to both JSON and text files"""
-        # Append to JSON file
-        with open(json_filename, "a", encoding="utf-8") as json_file:
-            if need_comma:
-                json_file.write(",\n")
-            json.dump(poem, json_file, ensure_ascii=False, indent=2)
+        start_subcatid: int = 1,
+        end_subcatid: int = 53,
+        json_filename: str = "output/rabindra_poems.json.gz",
+        txt_filename: str = "output/rabindra_poems.txt.gz",
+    ) -> int:
+        """
+        Scrape all collections and write poems to files one by one.
+        Returns the total number of poems scraped.
+        """
+        total_poems = 0
 
-        # Append to text file
-        with open(txt_filename, "a", encoding="utf-8") as txt_file:
-            txt_file.write("<start_poem>\n")
-            # Replace consecutive <line> patterns with <stanza>
-            content = poem["content"]
-            content = re.sub(r"(\n<line>)+\n", "\n<stanza>\n", content)
-            txt_file.write(content)
-            txt_file.write("\n<stanza>\n")
-            txt_file.write("<end_poem>\n")
+        with self._open_output_files(json_filename, txt_filename) as (
+            json_file,
+            txt_file,
+        ):
+            async with self._session_scope():
+                subcatids = range(start_subcatid, end_subcatid + 1)
+                # The index pages don't depend on each other, so fetch them
+                # all up front instead of one per finished collection
+                index_results = await asyncio.gather(
+                    *(self.get_collection_poems(subcatid) for subcatid in subcatids),
+                    return_exceptions=True,
+                )
+
+                # Every collection is scheduled at once against one semaphore;
+                # the results are still awaited, and written, in order
+                semaphore = asyncio.Semaphore(self.max_concurrent_poems)
+                collection_tasks = [
+                    result
+                    if isinstance(result, BaseException)
+                    else asyncio.ensure_future(self._scrape_poems(result, semaphore))
+                    for result in index_results
+                ]
+
+                for subcatid, task in zip(subcatids, collection_tasks):
+                    try:
+                        logger.info("--- Processing Collection %s ---", subcatid)
+                        if isinstance(task, BaseException):
+                            raise task
+                        collection_poems = await task
+
+                        # Write each poem immediately to both files
+                        for poem in collection_poems:
+                            self._append_poem_to_files(
+                                poem, json_file, txt_file, total_poems > 0
+                            )
+                            total_poems += 1
+                        json_file.flush()
+                        txt_file.flush()
+
+                        logger.info(
+                            "Scraped %d poems from collection %s",
+                            len(collection_poems),
+                            subcatid,
+                        )
+                    except Exception as e:
+                        logger.error("Error processing collection %s: %s", subcatid, e)
+                        continue
+
+        logger.info("Total poems scraped: %d", total_poems)
+        return total_poems
+
+    def run_all_collections(self, **kwargs) -> int:
+        """Synchronous entry point: run scrape_all_collections on an event loop"""
+        if uvloop is not None:
+            return uvloop.run(self.scrape_all_collections(**kwargs))
+        return asyncio.run(self.scrape_all_collections(**kwargs))